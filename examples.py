@@ -63,15 +63,15 @@ def socket_server_example():
         protocol="TCP"
     )
     
-    # 启动服务器并等待客户端连接
-    print("\n等待客户端连接...")
+    # 启动服务器（后台线程接受客户端连接）
+    print("\n启动服务器...")
     if not server.connect():
         print("服务器启动失败！")
         return
     
     try:
-        # 接收客户端指令
-        print("\n等待接收客户端指令...")
+        # 接收客户端指令（尚无客户端时会等待其连接）
+        print("\n等待客户端连接并接收指令...")
         command = server.receive_data(timeout=5.0)
         if command:
             print(f"接收到指令: {command}")
@@ -3,10 +3,49 @@
 支持RS232、RS485等串口通信
 """
 import serial
-import json
+import msgspec
+import os
 import time
-from typing import Optional, Dict, Any, List
-from teleop_interface import TeleopInterface
+import select
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Union
+from teleop_interface import TeleopInterface, TeleopMessage, get_json_codec
+from uring_transport import UringTransport
+
+# TeleopMessage对象按结构直接编码为JSON
+_encode_message = msgspec.json.Encoder().encode
+
+# 读取方法未传入timeout时的默认值：沿用当前生效的超时时间
+# （构造参数或temporary_timeout设置的值）；None仍表示一直等待
+_CURRENT_TIMEOUT: Any = object()
+
+
+def _freeze(value: Any) -> Any:
+    """将指令值转换为可哈希形式，保留类型信息以区分True/1/1.0等"""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+class _CommandKey:
+    """指令字典的可哈希包装，用作编码缓存的键"""
+    
+    __slots__ = ('command', '_key', '_hash')
+    
+    def __init__(self, command: Dict[str, Any]):
+        self.command = command
+        self._key = _freeze(command)
+        self._hash = hash(self._key)
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CommandKey) and self._key == other._key
 
 
 class SerialTeleopInterface(TeleopInterface):
@@ -14,7 +53,10 @@ class SerialTeleopInterface(TeleopInterface):
     
     def __init__(self, port: str = "/dev/ttyUSB0", baudrate: int = 115200,
                  timeout: float = 1.0, bytesize: int = 8, parity: str = 'N',
-                 stopbits: int = 1):
+                 stopbits: int = 1, volatile_keys: Tuple[str, ...] = ("timestamp",),
+                 encode_cache_size: int = 0, uring: Optional[UringTransport] = None,
+                 message_type: Any = Any, frame_delimiter: bytes = b'\n',
+                 json_codec: Optional[str] = None):
         """
         初始化串口接口
         
@@ -25,8 +67,21 @@ class SerialTeleopInterface(TeleopInterface):
             bytesize: 数据位 (5, 6, 7, 8)
             parity: 校验位 ('N':无, 'E':偶, 'O':奇, 'M':标记, 'S':空格)
             stopbits: 停止位 (1, 1.5, 2)
+            volatile_keys: 每次都会变化的字段（如时间戳），不参与编码缓存，
+                每次单独编码后拼接在JSON末尾
+            encode_cache_size: 指令编码缓存条目数，0表示不缓存（默认）。
+                小指令直接编码更快，仅在指令结构较大且重复发送时开启
+            uring: 可选的io_uring传输层（仅Linux），提供时写操作经由io_uring提交
+            message_type: 接收消息的类型（如TeleopMsg），指定后receive_data直接返回
+                对应的TeleopMessage对象；默认返回字典
+            frame_delimiter: 帧结束标记，默认为换行符（JSON Lines）；
+                下位机使用其他分隔符（如b'\r\n'）时修改此参数
+            json_codec: 字典指令使用的JSON实现（"orjson"、"msgspec"、"ujson"、"json"），
+                None表示自动选择（已安装orjson时使用orjson，否则使用msgspec）
         """
         super().__init__()
+        if not frame_delimiter:
+            raise ValueError("帧结束标记不能为空")
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
@@ -34,6 +89,24 @@ class SerialTeleopInterface(TeleopInterface):
         self.parity = parity
         self.stopbits = stopbits
         self.serial_port = None
+        self._current_timeout = None
+        
+        # 接收缓冲区：保存已读取但尚未组成完整一行的数据，跨调用保留
+        self._rx_buf = bytearray()
+        self._fd = None
+        self.frame_delimiter = bytes(frame_delimiter)
+        self.volatile_keys = tuple(volatile_keys)
+        self.uring = uring
+        
+        # 字典指令的JSON编解码；指定了消息类型时按类型解码
+        self._dumps, self._loads = get_json_codec(json_codec)
+        if message_type is not Any:
+            self._loads = msgspec.json.Decoder(message_type).decode
+        
+        # 重复发送相同指令（心跳、保持速度等）时跳过序列化
+        self._encode_cached = None
+        if encode_cache_size > 0:
+            self._encode_cached = lru_cache(maxsize=encode_cache_size)(self._encode_stable)
         
     def connect(self) -> bool:
         """打开串口连接"""
@@ -50,157 +123,397 @@ class SerialTeleopInterface(TeleopInterface):
             # 清空缓冲区
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
+            self._rx_buf.clear()
+            
+            # 预先绑定热路径上的方法，减少每次收发的属性查找
+            self._write = self.serial_port.write
+            self._flush = self.serial_port.flush
+            self._read = self.serial_port.read
+            
+            # POSIX下可以直接读入调用方提供的缓冲区
+            try:
+                self._fd = self.serial_port.fileno() if hasattr(os, 'readv') else None
+            except (AttributeError, OSError):
+                self._fd = None
             
+            self._current_timeout = self.timeout
             self.is_connected = True
-            self.logger.info(f"串口已打开: {self.port} @ {self.baudrate}bps")
+            self.logger.info("串口已打开: %s @ %sbps", self.port, self.baudrate)
             return True
             
         except serial.SerialException as e:
-            self.logger.error(f"打开串口失败: {e}")
+            self.logger.error("打开串口失败: %s", e)
             self.is_connected = False
             return False
         except Exception as e:
-            self.logger.error(f"串口初始化失败: {e}")
+            self.logger.error("串口初始化失败: %s", e)
             self.is_connected = False
             return False
     
+    def _apply_timeout(self, timeout: float):
+        """仅在超时时间变化时才修改串口设置，避免每次读取都触发系统调用"""
+        if timeout != self._current_timeout:
+            self.serial_port.timeout = timeout
+            self._current_timeout = timeout
+    
+    def _read_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """确定本次读取使用的超时时间，并同步到串口设置"""
+        if timeout is _CURRENT_TIMEOUT:
+            return self._current_timeout
+        self._apply_timeout(timeout)
+        return timeout
+    
+    @contextmanager
+    def temporary_timeout(self, timeout: float) -> Iterator[None]:
+        """
+        临时修改串口读取超时时间，退出作用域时恢复
+        
+        作用域内调用读取方法时不传入timeout即使用此超时时间
+        
+        Args:
+            timeout: 作用域内使用的超时时间（秒）
+        """
+        original_timeout = self._current_timeout
+        self._apply_timeout(timeout)
+        try:
+            yield
+        finally:
+            self._apply_timeout(original_timeout)
+    
     def disconnect(self) -> bool:
         """关闭串口连接"""
         try:
             if self.serial_port and self.serial_port.is_open:
                 self.serial_port.close()
-                self.logger.info(f"串口已关闭: {self.port}")
+                self.logger.info("串口已关闭: %s", self.port)
             self.is_connected = False
             return True
             
         except Exception as e:
-            self.logger.error(f"关闭串口失败: {e}")
+            self.logger.error("关闭串口失败: %s", e)
             return False
     
-    def send_command(self, command: Dict[str, Any]) -> bool:
+    def _on_uring_error(self, error: OSError):
+        """io_uring批量写入失败时的回调：标记为断开，后续调用直接快速失败"""
+        self.logger.error("串口写入失败: %s", error)
+        self.is_connected = False
+    
+    def _encode_stable(self, key: _CommandKey) -> Optional[bytes]:
+        """编码指令中不变的部分，返回去掉结尾'}'的JSON字节串；无法拼接时返回None"""
+        # 自定义JSON实现可能在末尾追加换行等空白，拼接前需要去掉
+        encoded = self._dumps(key.command).rstrip()
+        if not encoded.endswith(b'}'):
+            return None
+        return encoded[:-1]
+    
+    def _encode_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bytes:
+        """将指令编码为以帧结束标记结尾的JSON字节串"""
+        delimiter = self.frame_delimiter
+        if isinstance(command, TeleopMessage):
+            # 消息对象由msgspec按结构直接编码
+            return _encode_message(command) + delimiter
+        if self._encode_cached is None:
+            return self._dumps(command) + delimiter
+        
+        stable = command
+        volatile = [(k, command[k]) for k in self.volatile_keys if k in command]
+        if volatile:
+            stable = {k: v for k, v in command.items() if k not in self.volatile_keys}
+        
+        try:
+            prefix = self._encode_cached(_CommandKey(stable))
+        except TypeError:
+            # 指令中含有不可哈希或无法排序的内容，直接编码
+            return self._dumps(command) + delimiter
+        if prefix is None:
+            return self._dumps(command) + delimiter
+        
+        if not volatile:
+            return prefix + b'}' + delimiter
+        
+        # 变化字段单独编码后拼接到缓存结果末尾
+        dumps = self._dumps
+        tail = b','.join(dumps(k).rstrip() + b':' + dumps(v).rstrip() for k, v in volatile)
+        sep = b'' if prefix == b'{' else b','
+        return prefix + sep + tail + b'}' + delimiter
+    
+    def send_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bool:
         """
         发送控制指令
         
         Args:
-            command: 控制指令字典
+            command: 控制指令字典或TeleopMessage对象
             
         Returns:
             bool: 发送成功返回True
         """
-        if not self.is_connected or not self.serial_port or not self.serial_port.is_open:
+        if not self.is_connected:
             self.logger.error("串口未打开，无法发送指令")
             return False
         
         try:
-            # 将指令序列化为JSON，并添加换行符作为结束标记
-            data = (json.dumps(command) + '\n').encode('utf-8')
+            # 将指令序列化为JSON，并添加帧结束标记
+            data = self._encode_command(command)
             
-            bytes_written = self.serial_port.write(data)
-            self.serial_port.flush()  # 确保数据发送完成
+            if self.uring is not None:
+                bytes_written = self.uring.write(self.serial_port.fileno(), data, self._on_uring_error)
+            else:
+                bytes_written = self._write(data)
+                self._flush()  # 确保数据发送完成
             
-            self.logger.debug(f"指令已发送 ({bytes_written}字节): {command}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("指令已发送 (%s字节): %s", bytes_written, command)
             return True
             
+        except OSError as e:
+            # 串口设备异常（如USB被拔出），标记为断开，后续调用直接快速失败
+            self.logger.error("发送指令失败: %s", e)
+            self.is_connected = False
+            return False
         except Exception as e:
-            self.logger.error(f"发送指令失败: {e}")
+            self.logger.error("发送指令失败: %s", e)
             return False
     
-    def receive_data(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+    def send_commands_batch(self, commands: List[Union[Dict[str, Any], TeleopMessage]]) -> bool:
+        """
+        批量发送控制指令，所有指令拼接后一次写入串口
+        
+        Args:
+            commands: 控制指令字典或TeleopMessage对象列表
+            
+        Returns:
+            bool: 全部发送成功返回True
+        """
+        if not self.is_connected:
+            self.logger.error("串口未打开，无法发送指令")
+            return False
+        
+        try:
+            data = b''.join([self._encode_command(command) for command in commands])
+            
+            if self.uring is not None:
+                bytes_written = self.uring.write(self.serial_port.fileno(), data, self._on_uring_error)
+            else:
+                bytes_written = self._write(data)
+                self._flush()
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("批量指令已发送 (%s条, %s字节)", len(commands), bytes_written)
+            return True
+            
+        except OSError as e:
+            self.logger.error("批量发送指令失败: %s", e)
+            self.is_connected = False
+            return False
+        except Exception as e:
+            self.logger.error("批量发送指令失败: %s", e)
+            return False
+    
+    def _read_line(self, timeout: Optional[float]) -> Optional[int]:
+        """
+        确保接收缓冲区中有完整的一帧数据，返回帧结束标记的位置
+        
+        缓冲区中没有完整的一帧时，按串口当前可读字节数成块读取；
+        超时时未读完的部分留在缓冲区中，下次调用继续拼接。
+        timeout为None时一直等待，直到读到完整的一帧。
+        """
+        buf = self._rx_buf
+        delimiter = self.frame_delimiter
+        # 多字节的结束标记可能跨越两次读取，从上次末尾回退len-1个字节继续查找
+        overlap = len(delimiter) - 1
+        end = buf.find(delimiter)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while end < 0:
+            searched = max(0, len(buf) - overlap)
+            chunk = self._read(max(1, self.serial_port.in_waiting))
+            if not chunk:
+                return None
+            buf.extend(chunk)
+            end = buf.find(delimiter, searched)
+            if end < 0 and deadline is not None and time.monotonic() > deadline:
+                return None
+        return end
+    
+    def receive_data(self, timeout: Optional[float] = _CURRENT_TIMEOUT) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
         """
         接收机器人反馈数据
         
         Args:
-            timeout: 超时时间（秒）
+            timeout: 超时时间（秒），None表示一直等待；不传入时使用当前超时时间
             
         Returns:
-            Optional[Dict]: 接收到的数据字典
+            Optional[Union[Dict, TeleopMessage]]: 接收到的数据字典或消息对象
         """
-        if not self.is_connected or not self.serial_port or not self.serial_port.is_open:
+        if not self.is_connected:
             self.logger.error("串口未打开，无法接收数据")
             return None
         
         try:
-            # 临时设置超时时间
-            original_timeout = self.serial_port.timeout
-            self.serial_port.timeout = timeout
+            timeout = self._read_timeout(timeout)
             
-            # 读取一行数据（以换行符结束）
-            line = self.serial_port.readline()
+            # 读取一帧数据（以帧结束标记结束）
+            end = self._read_line(timeout)
             
-            # 恢复原始超时设置
-            self.serial_port.timeout = original_timeout
-            
-            if not line:
+            if end is None:
                 self.logger.debug("接收数据超时或无数据")
                 return None
             
-            # 解析JSON数据
-            result = json.loads(line.decode('utf-8').strip())
-            self.logger.debug(f"接收到数据: {result}")
+            # 直接在接收缓冲区上解析JSON，不为每行单独拷贝或解码为str
+            view = memoryview(self._rx_buf)
+            try:
+                result = self._loads(view[:end])
+            except ValueError as e:  # 各JSON实现的解析异常均继承自ValueError
+                self.logger.error("JSON解析失败: %s, 原始数据: %s", e, bytes(view[:end]))
+                return None
+            finally:
+                view.release()
+                del self._rx_buf[:end + len(self.frame_delimiter)]
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("接收到数据: %s", result)
             return result
             
-        except json.JSONDecodeError as e:
-            self.logger.error(f"JSON解析失败: {e}, 原始数据: {line}")
+        except OSError as e:
+            self.logger.error("接收数据失败: %s", e)
+            self.is_connected = False
             return None
         except Exception as e:
-            self.logger.error(f"接收数据失败: {e}")
+            self.logger.error("接收数据失败: %s", e)
             return None
     
-    def send_raw_bytes(self, data: bytes) -> bool:
+    def send_raw_bytes(self, data: Union[bytes, bytearray, memoryview]) -> bool:
         """
         发送原始字节数据
         
         Args:
-            data: 要发送的字节数据
+            data: 要发送的字节数据，支持任何实现缓冲区协议的对象
+                (bytes、bytearray、memoryview等)，调用方无需先转换为bytes
             
         Returns:
             bool: 发送成功返回True
         """
-        if not self.is_connected or not self.serial_port or not self.serial_port.is_open:
+        if not self.is_connected:
             self.logger.error("串口未打开，无法发送数据")
             return False
         
         try:
-            bytes_written = self.serial_port.write(data)
-            self.serial_port.flush()
-            self.logger.debug(f"原始数据已发送 ({bytes_written}字节)")
+            if self.uring is not None:
+                bytes_written = self.uring.write(self.serial_port.fileno(), data, self._on_uring_error)
+            else:
+                bytes_written = self._write(data)
+                self._flush()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("原始数据已发送 (%s字节)", bytes_written)
             return True
+        except OSError as e:
+            self.logger.error("发送原始数据失败: %s", e)
+            self.is_connected = False
+            return False
         except Exception as e:
-            self.logger.error(f"发送原始数据失败: {e}")
+            self.logger.error("发送原始数据失败: %s", e)
             return False
     
-    def receive_raw_bytes(self, size: int = 1, timeout: float = 1.0) -> Optional[bytes]:
+    def receive_raw_bytes(self, size: int = 1,
+                          timeout: Optional[float] = _CURRENT_TIMEOUT) -> Optional[bytes]:
         """
         接收原始字节数据
         
         Args:
             size: 要读取的字节数
-            timeout: 超时时间（秒）
+            timeout: 超时时间（秒），None表示一直等待；不传入时使用当前超时时间
             
         Returns:
             Optional[bytes]: 接收到的字节数据
         """
-        if not self.is_connected or not self.serial_port or not self.serial_port.is_open:
+        if not self.is_connected:
             self.logger.error("串口未打开，无法接收数据")
             return None
         
         try:
-            original_timeout = self.serial_port.timeout
-            self.serial_port.timeout = timeout
-            
-            data = self.serial_port.read(size)
+            self._read_timeout(timeout)
             
-            self.serial_port.timeout = original_timeout
+            # 先取出接收缓冲区中残留的数据
+            data = bytes(self._rx_buf[:size])
+            del self._rx_buf[:size]
+            if len(data) < size:
+                data += self._read(size - len(data))
             
             if not data:
                 self.logger.debug("接收数据超时或无数据")
                 return None
             
-            self.logger.debug(f"接收到原始数据 ({len(data)}字节)")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("接收到原始数据 (%s字节)", len(data))
             return data
             
+        except OSError as e:
+            self.logger.error("接收原始数据失败: %s", e)
+            self.is_connected = False
+            return None
+        except Exception as e:
+            self.logger.error("接收原始数据失败: %s", e)
+            return None
+    
+    def receive_raw_bytes_into(self, buffer: Union[bytearray, memoryview],
+                               timeout: Optional[float] = _CURRENT_TIMEOUT) -> Optional[int]:
+        """
+        接收原始字节数据到调用方预先分配的缓冲区，读满缓冲区或超时后返回
+        
+        POSIX下直接从串口文件描述符读入缓冲区，避免为每次接收分配新的bytes对象
+        （适合图像帧等大块数据的连续接收）
+        
+        Args:
+            buffer: 可写的缓冲区（bytearray、memoryview等）
+            timeout: 超时时间（秒），None表示一直等待；不传入时使用当前超时时间
+            
+        Returns:
+            Optional[int]: 实际读取的字节数，超时且无数据返回None
+        """
+        if not self.is_connected:
+            self.logger.error("串口未打开，无法接收数据")
+            return None
+        
+        try:
+            timeout = self._read_timeout(timeout)
+            with memoryview(buffer).cast('B') as view:
+                size = len(view)
+                
+                # 先取出接收缓冲区中残留的数据
+                count = min(len(self._rx_buf), size)
+                if count:
+                    view[:count] = self._rx_buf[:count]
+                    del self._rx_buf[:count]
+                
+                if count < size and self._fd is not None:
+                    deadline = None if timeout is None else time.monotonic() + timeout
+                    while count < size:
+                        # 超时为0时仍至少轮询一次，读取已到达的数据
+                        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                        if not select.select([self._fd], [], [], remaining)[0]:
+                            break
+                        n = os.readv(self._fd, [view[count:]])
+                        if n == 0:
+                            raise serial.SerialException("串口设备已断开或无数据可读")
+                        count += n
+                elif count < size:
+                    data = self._read(size - count)
+                    view[count:count + len(data)] = data
+                    count += len(data)
+            
+            if not count:
+                self.logger.debug("接收数据超时或无数据")
+                return None
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("接收到原始数据 (%s字节)", count)
+            return count
+            
+        except OSError as e:
+            self.logger.error("接收原始数据失败: %s", e)
+            self.is_connected = False
+            return None
         except Exception as e:
-            self.logger.error(f"接收原始数据失败: {e}")
+            self.logger.error("接收原始数据失败: %s", e)
             return None
     
     def clear_buffers(self):
@@ -208,6 +521,7 @@ class SerialTeleopInterface(TeleopInterface):
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
+            self._rx_buf.clear()
             self.logger.debug("串口缓冲区已清空")
     
     @staticmethod
@@ -223,5 +537,5 @@ class SerialTeleopInterface(TeleopInterface):
             ports = [port.device for port in serial.tools.list_ports.comports()]
             return ports
         except Exception as e:
-            logging.error(f"列出串口失败: {e}")
+            logging.error("列出串口失败: %s", e)
             return []
@@ -2,17 +2,117 @@
 基于Socket的机器人遥操作接口
 支持TCP和UDP两种协议
 """
+import errno
 import socket
-import json
-from typing import Optional, Dict, Any
-from teleop_interface import TeleopInterface
+import struct
+import asyncio
+import logging
+import selectors
+import queue
+import threading
+import msgspec
+from typing import Optional, Dict, Any, List, Union, Tuple
+from teleop_interface import TeleopInterface, AsyncTeleopInterface, TeleopMessage
+
+# TCP消息帧头：4字节大端无符号整数，表示消息体长度
+_FRAME_HEADER = struct.Struct('>I')
+
+# 默认允许的最大消息体长度，超出时视为数据流错位或非法对端
+_DEFAULT_MAX_FRAME_SIZE = 4 * 1024 * 1024
+
+# 固定的内核收发缓冲区大小，避免自动调优带来的延迟抖动
+_SOCKET_BUFFER_SIZE = 65536
+
+# accept()因文件描述符耗尽失败时，重试前等待的秒数
+_ACCEPT_BACKOFF = 0.1
+_ACCEPT_BACKOFF_ERRNOS = (errno.EMFILE, errno.ENFILE, errno.ENOBUFS, errno.ENOMEM)
+
+
+def _tune_tcp_socket(sock: socket.socket):
+    """为低延迟指令流配置TCP socket：关闭Nagle算法并固定收发缓冲区"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+
+
+def _frame(data: bytes) -> bytes:
+    """为消息体添加长度前缀，用于TCP流式传输"""
+    return _FRAME_HEADER.pack(len(data)) + data
+
+
+# 单次sendmsg可携带的缓冲区数量上限（Linux的IOV_MAX）
+_IOV_MAX = 1024
+
+
+def _sendmsg_all(sock: socket.socket, buffers: List[bytes]):
+    """用scatter-gather方式发送多个缓冲区，处理部分发送"""
+    if not hasattr(sock, 'sendmsg'):  # Windows不支持sendmsg
+        sock.sendall(b''.join(buffers))
+        return
+    
+    views = [memoryview(buf) for buf in buffers]
+    start = 0
+    while start < len(views):
+        sent = sock.sendmsg(views[start:start + _IOV_MAX])
+        # 跳过已完整发送的缓冲区，截断发送了一部分的缓冲区
+        while sent and sent >= len(views[start]):
+            sent -= len(views[start])
+            start += 1
+        if sent:
+            views[start] = views[start][sent:]
+
+
+class _FrameReader:
+    """
+    TCP长度前缀帧读取器
+    
+    复用同一个bytearray作为接收缓冲区；读取超时时已收到的部分数据会保留，
+    下一次调用从断点继续，保证字节流不会错位。
+    帧头声明的长度超过max_frame_size时不分配缓冲区，直接按连接错误处理。
+    """
+    
+    def __init__(self, buffer_size: int = 4096, max_frame_size: int = _DEFAULT_MAX_FRAME_SIZE):
+        self._buf = bytearray(buffer_size)
+        self._got = 0
+        self._length = None
+        self.max_frame_size = max_frame_size
+    
+    def reset(self):
+        """丢弃未读完的帧（更换连接时调用）"""
+        self._got = 0
+        self._length = None
+    
+    def _recv_exact(self, sock: socket.socket, n: int) -> memoryview:
+        """从socket读满n字节，返回缓冲区视图"""
+        if len(self._buf) < n:
+            self._buf.extend(bytes(n - len(self._buf)))
+        view = memoryview(self._buf)
+        while self._got < n:
+            count = sock.recv_into(view[self._got:n])
+            if count == 0:
+                raise ConnectionError("连接已被对端关闭")
+            self._got += count
+        self._got = 0
+        return view[:n]
+    
+    def read_frame(self, sock: socket.socket) -> memoryview:
+        """读取一个完整的消息体"""
+        if self._length is None:
+            length = _FRAME_HEADER.unpack(self._recv_exact(sock, _FRAME_HEADER.size))[0]
+            if length > self.max_frame_size:
+                raise ConnectionError(f"消息帧长度{length}超出上限{self.max_frame_size}，数据流可能已错位")
+            self._length = length
+        body = self._recv_exact(sock, self._length)
+        self._length = None
+        return body
 
 
 class SocketTeleopInterface(TeleopInterface):
     """Socket遥操作接口"""
     
     def __init__(self, host: str = "127.0.0.1", port: int = 8888, 
-                 protocol: str = "TCP", buffer_size: int = 4096):
+                 protocol: str = "TCP", buffer_size: int = 4096,
+                 message_type: Any = Any, max_frame_size: int = _DEFAULT_MAX_FRAME_SIZE):
         """
         初始化Socket接口
         
@@ -21,6 +121,9 @@ class SocketTeleopInterface(TeleopInterface):
             port: 端口号
             protocol: 协议类型，"TCP"或"UDP"
             buffer_size: 接收缓冲区大小
+            message_type: 接收消息的类型（如TeleopMsg），指定后receive_data直接返回
+                对应的TeleopMessage对象；默认返回字典
+            max_frame_size: TCP模式下允许的最大消息体长度（字节），超出时断开连接
         """
         super().__init__()
         self.host = host
@@ -28,6 +131,19 @@ class SocketTeleopInterface(TeleopInterface):
         self.protocol = protocol.upper()
         self.buffer_size = buffer_size
         self.socket = None
+        self._reader = _FrameReader(buffer_size, max_frame_size)
+        self._timeout = None
+        self._selector = None
+        
+        # UDP接收复用同一块缓冲区，避免每次接收都分配新的bytes对象
+        self._recv_buf = bytearray(buffer_size)
+        self._recv_mv = memoryview(self._recv_buf)
+        
+        # 复用MessagePack编解码器，避免每次收发重复创建
+        self._enc = msgspec.msgpack.Encoder()
+        self._dec = msgspec.msgpack.Decoder(message_type)
+        self._encode = self._enc.encode
+        self._decode = self._dec.decode
         
         if self.protocol not in ["TCP", "UDP"]:
             raise ValueError("协议类型必须是TCP或UDP")
@@ -37,23 +153,39 @@ class SocketTeleopInterface(TeleopInterface):
         try:
             if self.protocol == "TCP":
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                _tune_tcp_socket(self.socket)
                 self.socket.connect((self.host, self.port))
-                self.logger.info(f"TCP连接成功: {self.host}:{self.port}")
+                self._reader.reset()
+                self._timeout = None
+                self.logger.info("TCP连接成功: %s:%s", self.host, self.port)
             else:  # UDP
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                self.logger.info(f"UDP Socket创建成功: {self.host}:{self.port}")
+                # UDP使用非阻塞socket + selector等待数据，无需每次接收都设置超时
+                self.socket.setblocking(False)
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self.socket, selectors.EVENT_READ)
+                self.logger.info("UDP Socket创建成功: %s:%s", self.host, self.port)
+            
+            # 预先绑定热路径上的方法，减少每次收发的属性查找
+            self._address = (self.host, self.port)
+            self._sendall = self.socket.sendall
+            self._sendto = self.socket.sendto
+            self._recvfrom_into = self.socket.recvfrom_into
             
             self.is_connected = True
             return True
             
         except Exception as e:
-            self.logger.error(f"连接失败: {e}")
+            self.logger.error("连接失败: %s", e)
             self.is_connected = False
             return False
     
     def disconnect(self) -> bool:
         """断开Socket连接"""
         try:
+            if self._selector:
+                self._selector.close()
+                self._selector = None
             if self.socket:
                 self.socket.close()
                 self.socket = None
@@ -62,40 +194,109 @@ class SocketTeleopInterface(TeleopInterface):
             return True
             
         except Exception as e:
-            self.logger.error(f"断开连接失败: {e}")
+            self.logger.error("断开连接失败: %s", e)
             return False
     
-    def send_command(self, command: Dict[str, Any]) -> bool:
+    def _drop_connection(self):
+        """
+        TCP连接失效时关闭socket并标记为断开，后续调用直接快速失败，需重新connect()
+        
+        UDP没有连接状态，ConnectionError（如Windows上收到ICMP端口不可达）只影响本次收发
+        """
+        if self.protocol != "TCP":
+            return
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+        self.is_connected = False
+    
+    def send_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bool:
         """
         发送控制指令
         
         Args:
-            command: 控制指令字典
+            command: 控制指令字典或TeleopMessage对象
             
         Returns:
             bool: 发送成功返回True
         """
-        if not self.is_connected or not self.socket:
+        if not self.is_connected:
             self.logger.error("未连接，无法发送指令")
             return False
         
         try:
-            # 将指令序列化为JSON
-            data = json.dumps(command).encode('utf-8')
+            # 将指令序列化为MessagePack
+            data = self._encode(command)
+        except Exception as e:
+            self.logger.error("指令编码失败: %s", e)
+            return False
+        
+        try:
+            if self.protocol == "TCP":
+                self._sendall(_frame(data))
+            else:  # UDP
+                self._sendto(data, self._address)
             
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("指令已发送: %s", command)
+            return True
+            
+        except Exception as e:
+            # TCP发送中途出错（包括超时）时线路上可能残留半个帧，后续帧无法再对齐，只能断开
+            self.logger.error("发送指令失败: %s", e)
+            self._drop_connection()
+            return False
+    
+    def send_commands_batch(self, commands: List[Union[Dict[str, Any], TeleopMessage]]) -> bool:
+        """
+        批量发送控制指令
+        
+        TCP模式下所有指令帧通过一次sendmsg系统调用发出；UDP模式下逐条发送
+        
+        Args:
+            commands: 控制指令字典或TeleopMessage对象列表
+            
+        Returns:
+            bool: 全部发送成功返回True
+        """
+        if not self.is_connected:
+            self.logger.error("未连接，无法发送指令")
+            return False
+        
+        encode = self._encode
+        try:
+            if self.protocol == "TCP":
+                buffers = []
+                pack = _FRAME_HEADER.pack
+                for command in commands:
+                    data = encode(command)
+                    buffers.append(pack(len(data)))
+                    buffers.append(data)
+            else:  # UDP
+                datagrams = [encode(command) for command in commands]
+        except Exception as e:
+            self.logger.error("批量指令编码失败: %s", e)
+            return False
+        
+        try:
             if self.protocol == "TCP":
-                self.socket.sendall(data)
+                _sendmsg_all(self.socket, buffers)
             else:  # UDP
-                self.socket.sendto(data, (self.host, self.port))
+                sendto, address = self._sendto, self._address
+                for data in datagrams:
+                    sendto(data, address)
             
-            self.logger.debug(f"指令已发送: {command}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("批量指令已发送: %s条", len(commands))
             return True
             
         except Exception as e:
-            self.logger.error(f"发送指令失败: {e}")
+            # 同send_command：TCP发送中途出错后帧边界已不可靠
+            self.logger.error("批量发送指令失败: %s", e)
+            self._drop_connection()
             return False
     
-    def receive_data(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+    def receive_data(self, timeout: float = 1.0) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
         """
         接收机器人反馈数据
         
@@ -103,34 +304,47 @@ class SocketTeleopInterface(TeleopInterface):
             timeout: 超时时间（秒）
             
         Returns:
-            Optional[Dict]: 接收到的数据字典
+            Optional[Union[Dict, TeleopMessage]]: 接收到的数据字典或消息对象
         """
-        if not self.is_connected or not self.socket:
+        if not self.is_connected:
             self.logger.error("未连接，无法接收数据")
             return None
         
         try:
-            # 设置超时时间
-            self.socket.settimeout(timeout)
-            
             if self.protocol == "TCP":
-                data = self.socket.recv(self.buffer_size)
+                # 仅在超时时间变化时重新设置
+                if timeout != self._timeout:
+                    self.socket.settimeout(timeout)
+                    self._timeout = timeout
+                data = self._reader.read_frame(self.socket)
             else:  # UDP
-                data, _ = self.socket.recvfrom(self.buffer_size)
+                if not self._selector.select(timeout):
+                    self.logger.debug("接收数据超时")
+                    return None
+                count, _ = self._recvfrom_into(self._recv_mv)
+                data = self._recv_mv[:count]
             
             if not data:
                 return None
             
-            # 解析JSON数据
-            result = json.loads(data.decode('utf-8'))
-            self.logger.debug(f"接收到数据: {result}")
+            # 解析MessagePack数据（直接解码缓冲区视图，无需拷贝）
+            result = self._decode(data)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("接收到数据: %s", result)
             return result
             
         except socket.timeout:
             self.logger.debug("接收数据超时")
             return None
+        except msgspec.DecodeError as e:
+            self.logger.error("MessagePack解析失败: %s, 原始数据: %s", e, bytes(data))
+            return None
+        except ConnectionError as e:
+            self.logger.error("接收数据失败: %s", e)
+            self._drop_connection()
+            return None
         except Exception as e:
-            self.logger.error(f"接收数据失败: {e}")
+            self.logger.error("接收数据失败: %s", e)
             return None
 
 
@@ -138,7 +352,8 @@ class SocketTeleopServer(TeleopInterface):
     """Socket遥操作服务器端"""
     
     def __init__(self, host: str = "0.0.0.0", port: int = 8888, 
-                 protocol: str = "TCP", buffer_size: int = 4096):
+                 protocol: str = "TCP", buffer_size: int = 4096,
+                 message_type: Any = Any, max_frame_size: int = _DEFAULT_MAX_FRAME_SIZE):
         """
         初始化Socket服务器
         
@@ -147,6 +362,9 @@ class SocketTeleopServer(TeleopInterface):
             port: 端口号
             protocol: 协议类型，"TCP"或"UDP"
             buffer_size: 接收缓冲区大小
+            message_type: 接收消息的类型（如TeleopMsg），指定后receive_data直接返回
+                对应的TeleopMessage对象；默认返回字典
+            max_frame_size: TCP模式下允许的最大消息体长度（字节），超出时断开连接
         """
         super().__init__()
         self.host = host
@@ -156,43 +374,148 @@ class SocketTeleopServer(TeleopInterface):
         self.server_socket = None
         self.client_socket = None
         self.client_address = None
+        self._reader = _FrameReader(buffer_size, max_frame_size)
+        self._timeout = None
+        self._selector = None
+        
+        # TCP模式下由后台线程接受连接，新客户端经队列交给收发线程
+        self._client_queue: "queue.Queue[Tuple[socket.socket, Any]]" = queue.Queue()
+        self._accept_thread = None
+        self._stop = threading.Event()
+        
+        # UDP接收复用同一块缓冲区，避免每次接收都分配新的bytes对象
+        self._recv_buf = bytearray(buffer_size)
+        self._recv_mv = memoryview(self._recv_buf)
+        
+        # 复用MessagePack编解码器，避免每次收发重复创建
+        self._enc = msgspec.msgpack.Encoder()
+        self._dec = msgspec.msgpack.Decoder(message_type)
+        self._encode = self._enc.encode
+        self._decode = self._dec.decode
         
         if self.protocol not in ["TCP", "UDP"]:
             raise ValueError("协议类型必须是TCP或UDP")
     
     def connect(self) -> bool:
-        """启动服务器并等待客户端连接"""
+        """
+        启动服务器
+        
+        TCP模式下在后台线程中接受客户端连接，本方法立即返回；
+        收发数据时使用已接受的客户端
+        """
         try:
             if self.protocol == "TCP":
                 self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if hasattr(socket, "SO_REUSEPORT"):
+                    self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
                 self.server_socket.bind((self.host, self.port))
-                self.server_socket.listen(1)
-                self.logger.info(f"TCP服务器监听中: {self.host}:{self.port}")
+                self.server_socket.listen(16)
+                self.logger.info("TCP服务器监听中: %s:%s", self.host, self.port)
                 
-                # 等待客户端连接
-                self.client_socket, self.client_address = self.server_socket.accept()
-                self.logger.info(f"客户端已连接: {self.client_address}")
+                # 后台线程接受客户端连接
+                self._stop.clear()
+                self._accept_thread = threading.Thread(
+                    target=self._accept_loop, args=(self.server_socket,), daemon=True)
+                self._accept_thread.start()
                 
             else:  # UDP
                 self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
                 self.server_socket.bind((self.host, self.port))
-                self.logger.info(f"UDP服务器启动: {self.host}:{self.port}")
+                # UDP使用非阻塞socket + selector等待数据，无需每次接收都设置超时
+                self.server_socket.setblocking(False)
+                self._selector = selectors.DefaultSelector()
+                self._selector.register(self.server_socket, selectors.EVENT_READ)
+                self.logger.info("UDP服务器启动: %s:%s", self.host, self.port)
             
             self.is_connected = True
             return True
             
         except Exception as e:
-            self.logger.error(f"服务器启动失败: {e}")
+            self.logger.error("服务器启动失败: %s", e)
             self.is_connected = False
             return False
     
+    def _accept_loop(self, server_socket: socket.socket):
+        """后台线程：持续接受客户端连接并放入队列"""
+        while not self._stop.is_set():
+            try:
+                client_socket, client_address = server_socket.accept()
+            except OSError as e:
+                if self._stop.is_set() or server_socket.fileno() == -1:
+                    break  # 服务器socket已关闭
+                # 客户端在握手后立即断开等属于个别连接的错误，不应停止接受新连接
+                self.logger.warning("接受客户端连接失败: %s", e)
+                if e.errno in _ACCEPT_BACKOFF_ERRNOS:
+                    # 文件描述符耗尽时立即重试只会空转，等待一段时间让已有连接释放
+                    self._stop.wait(_ACCEPT_BACKOFF)
+                continue
+            if self._stop.is_set():
+                client_socket.close()
+                break
+            try:
+                _tune_tcp_socket(client_socket)
+            except OSError as e:
+                self.logger.warning("客户端连接设置失败: %s, %s", client_address, e)
+                client_socket.close()
+                continue
+            self.logger.info("客户端已连接: %s", client_address)
+            self._client_queue.put((client_socket, client_address))
+    
+    def _poll_client(self, timeout: Optional[float] = 0.0) -> bool:
+        """
+        确保有可用的TCP客户端
+        
+        当前没有客户端时从队列中取出下一个已接受的连接，最多等待timeout秒，
+        timeout为None时一直等待
+        
+        Returns:
+            bool: 有可用客户端返回True
+        """
+        if self.client_socket is not None:
+            return True
+        try:
+            if timeout is None or timeout > 0:
+                client_socket, client_address = self._client_queue.get(timeout=timeout)
+            else:
+                client_socket, client_address = self._client_queue.get_nowait()
+        except queue.Empty:
+            return False
+        
+        self.client_socket, self.client_address = client_socket, client_address
+        self._reader.reset()
+        self._timeout = None
+        return True
+    
+    def _drop_client(self):
+        """关闭当前客户端连接，后续收发将使用队列中的下一个客户端"""
+        if self.client_socket:
+            self.client_socket.close()
+            self.client_socket = None
+            self.logger.info("客户端已断开: %s", self.client_address)
+    
     def disconnect(self) -> bool:
         """断开连接并关闭服务器"""
         try:
+            self._stop.set()
+            if self.server_socket and self.protocol == "TCP":
+                # 关闭监听socket的读写，唤醒阻塞在accept()上的后台线程
+                try:
+                    self.server_socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            if self._accept_thread:
+                # 先等待后台线程退出，之后队列中不会再有新的客户端
+                self._accept_thread.join(timeout=1.0)
+                self._accept_thread = None
             if self.client_socket:
                 self.client_socket.close()
                 self.client_socket = None
+            while not self._client_queue.empty():
+                self._client_queue.get_nowait()[0].close()
+            if self._selector:
+                self._selector.close()
+                self._selector = None
             if self.server_socket:
                 self.server_socket.close()
                 self.server_socket = None
@@ -201,63 +524,313 @@ class SocketTeleopServer(TeleopInterface):
             return True
             
         except Exception as e:
-            self.logger.error(f"关闭服务器失败: {e}")
+            self.logger.error("关闭服务器失败: %s", e)
             return False
     
-    def send_command(self, command: Dict[str, Any]) -> bool:
+    def send_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bool:
         """发送数据到客户端"""
         if not self.is_connected:
             self.logger.error("服务器未启动")
             return False
         
         try:
-            data = json.dumps(command).encode('utf-8')
-            
+            data = self._encode(command)
+        except Exception as e:
+            self.logger.error("数据编码失败: %s", e)
+            return False
+        
+        try:
             if self.protocol == "TCP":
-                if not self.client_socket:
+                if not self._poll_client():
                     self.logger.error("没有连接的客户端")
                     return False
-                self.client_socket.sendall(data)
+                self.client_socket.sendall(_frame(data))
             else:  # UDP
                 if not self.client_address:
                     self.logger.error("没有客户端地址")
                     return False
                 self.server_socket.sendto(data, self.client_address)
             
-            self.logger.debug(f"数据已发送: {command}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("数据已发送: %s", command)
             return True
             
         except Exception as e:
-            self.logger.error(f"发送数据失败: {e}")
+            self.logger.error("发送数据失败: %s", e)
+            if self.protocol == "TCP":
+                # 发送中途出错（包括超时）时客户端可能收到半个帧，帧边界已不可靠
+                self._drop_client()
             return False
     
-    def receive_data(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
-        """接收客户端数据"""
+    def receive_data(self, timeout: float = 1.0) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
+        """接收客户端数据（TCP模式下尚无客户端时最多等待timeout秒，timeout为None时一直等待）"""
         if not self.is_connected:
             self.logger.error("服务器未启动")
             return None
         
         try:
             if self.protocol == "TCP":
-                if not self.client_socket:
-                    self.logger.error("没有连接的客户端")
+                if not self._poll_client(timeout):
+                    self.logger.debug("等待客户端连接超时")
                     return None
-                self.client_socket.settimeout(timeout)
-                data = self.client_socket.recv(self.buffer_size)
+                # 仅在超时时间变化时重新设置
+                if timeout != self._timeout:
+                    self.client_socket.settimeout(timeout)
+                    self._timeout = timeout
+                data = self._reader.read_frame(self.client_socket)
             else:  # UDP
-                self.server_socket.settimeout(timeout)
-                data, self.client_address = self.server_socket.recvfrom(self.buffer_size)
+                if not self._selector.select(timeout):
+                    self.logger.debug("接收数据超时")
+                    return None
+                count, self.client_address = self.server_socket.recvfrom_into(self._recv_mv)
+                data = self._recv_mv[:count]
             
             if not data:
                 return None
             
-            result = json.loads(data.decode('utf-8'))
-            self.logger.debug(f"接收到数据: {result}")
+            result = self._decode(data)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("接收到数据: %s", result)
             return result
             
         except socket.timeout:
             self.logger.debug("接收数据超时")
             return None
+        except msgspec.DecodeError as e:
+            self.logger.error("MessagePack解析失败: %s, 原始数据: %s", e, bytes(data))
+            return None
+        except ConnectionError as e:
+            self.logger.error("接收数据失败: %s", e)
+            self._drop_client()
+            return None
+        except Exception as e:
+            self.logger.error("接收数据失败: %s", e)
+            return None
+
+
+class SocketTeleopServerAsync(AsyncTeleopInterface):
+    """
+    基于asyncio的TCP遥操作服务器
+    
+    在单个事件循环中同时服务多个客户端（如多台机器人），每个连接由一个协程读取，
+    收到的消息连同客户端地址放入同一个有界队列；队列满时读取协程暂停，
+    由TCP流量控制对发送过快的客户端施加背压。消息帧格式与SocketTeleopServer相同。
+    """
+    
+    def __init__(self, host: str = "0.0.0.0", port: int = 8888,
+                 message_type: Any = Any, max_frame_size: int = _DEFAULT_MAX_FRAME_SIZE,
+                 max_pending: int = 1024):
+        """
+        初始化异步服务器
+        
+        Args:
+            host: 监听地址
+            port: 端口号
+            message_type: 接收消息的类型（如TeleopMsg），指定后receive_data直接返回
+                对应的TeleopMessage对象；默认返回字典
+            max_frame_size: 允许的最大消息体长度（字节），超出时断开该客户端
+            max_pending: 接收队列中最多缓存的消息数
+        """
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.max_frame_size = max_frame_size
+        self.max_pending = max_pending
+        self.server = None
+        self.client_address = None
+        self._clients: Dict[Any, asyncio.StreamWriter] = {}
+        self._handlers: "set[asyncio.Task]" = set()
+        self._inbox: Optional["asyncio.Queue[Tuple[Any, Any]]"] = None
+        
+        # 复用MessagePack编解码器，避免每次收发重复创建
+        self._enc = msgspec.msgpack.Encoder()
+        self._dec = msgspec.msgpack.Decoder(message_type)
+        self._encode = self._enc.encode
+        self._decode = self._dec.decode
+    
+    @property
+    def clients(self) -> List[Any]:
+        """当前已连接的客户端地址列表"""
+        return list(self._clients)
+    
+    async def connect(self) -> bool:
+        """启动服务器，客户端连接由事件循环在后台接受"""
+        try:
+            self._inbox = asyncio.Queue(self.max_pending)
+            self.server = await asyncio.start_server(
+                self._on_client_connected, self.host, self.port, backlog=16)
+            self.logger.info("异步TCP服务器监听中: %s:%s", self.host, self.port)
+            self.is_connected = True
+            return True
+            
+        except Exception as e:
+            self.logger.error("服务器启动失败: %s", e)
+            self.is_connected = False
+            return False
+    
+    def _on_client_connected(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        新连接回调：为客户端创建读取任务
+        
+        任务由服务器自己持有，而不是交给start_server包装，
+        这样disconnect()取消任务时CancelledError可以正常传播，不会被当作回调异常记录
+        """
+        handler = asyncio.ensure_future(self._handle_client(reader, writer))
+        self._handlers.add(handler)
+        handler.add_done_callback(self._handlers.discard)
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """单个客户端的读取协程：按长度前缀拆帧，解码后放入接收队列"""
+        client_address = writer.get_extra_info('peername')
+        try:
+            _tune_tcp_socket(writer.get_extra_info('socket'))
+            self._clients[client_address] = writer
+            self.logger.info("客户端已连接: %s", client_address)
+            while True:
+                header = await reader.readexactly(_FRAME_HEADER.size)
+                length = _FRAME_HEADER.unpack(header)[0]
+                if length > self.max_frame_size:
+                    self.logger.error("消息帧长度%s超出上限%s，断开客户端: %s",
+                                      length, self.max_frame_size, client_address)
+                    break
+                body = await reader.readexactly(length)
+                try:
+                    message = self._decode(body)
+                except msgspec.DecodeError as e:
+                    self.logger.error("MessagePack解析失败: %s, 原始数据: %s", e, body)
+                    continue
+                await self._inbox.put((client_address, message))
+        except asyncio.IncompleteReadError:
+            pass  # 客户端关闭了连接
+        except OSError as e:
+            self.logger.error("接收数据失败: %s", e)
+        finally:
+            # 服务器关闭时的取消在清理后继续向上传播，由disconnect()回收
+            self._clients.pop(client_address, None)
+            writer.close()
+            self.logger.info("客户端已断开: %s", client_address)
+    
+    async def disconnect(self) -> bool:
+        """断开所有客户端并关闭服务器"""
+        try:
+            if self.server:
+                self.server.close()
+                # 读取协程可能阻塞在已满的接收队列上，直接取消
+                for handler in list(self._handlers):
+                    handler.cancel()
+                await asyncio.gather(*list(self._handlers), return_exceptions=True)
+                await self.server.wait_closed()
+                self.server = None
+            self.logger.info("服务器已关闭")
+            self.is_connected = False
+            return True
+            
+        except Exception as e:
+            self.logger.error("关闭服务器失败: %s", e)
+            return False
+    
+    def _get_writer(self, client_address: Any) -> Optional[asyncio.StreamWriter]:
+        """查找目标客户端，未指定时使用最近一次发来数据的客户端"""
+        if client_address is None:
+            client_address = self.client_address
+        return self._clients.get(client_address)
+    
+    async def send_command(self, command: Union[Dict[str, Any], TeleopMessage],
+                           client_address: Any = None) -> bool:
+        """
+        发送数据到客户端
+        
+        Args:
+            command: 控制指令字典或TeleopMessage对象
+            client_address: 目标客户端地址，None表示最近一次发来数据的客户端
+            
+        Returns:
+            bool: 发送成功返回True
+        """
+        if not self.is_connected:
+            self.logger.error("服务器未启动")
+            return False
+        
+        writer = self._get_writer(client_address)
+        if writer is None:
+            self.logger.error("没有连接的客户端")
+            return False
+        
+        try:
+            writer.write(_frame(self._encode(command)))
+            await writer.drain()
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("数据已发送: %s", command)
+            return True
+            
+        except ConnectionError as e:
+            self.logger.error("发送数据失败: %s", e)
+            return False
+        except Exception as e:
+            self.logger.error("发送数据失败: %s", e)
+            return False
+    
+    async def send_commands_batch(self, commands: List[Union[Dict[str, Any], TeleopMessage]],
+                                  client_address: Any = None) -> bool:
+        """
+        批量发送数据到客户端，所有帧写入后只等待一次发送缓冲区排空
+        
+        Args:
+            commands: 控制指令字典或TeleopMessage对象列表
+            client_address: 目标客户端地址，None表示最近一次发来数据的客户端
+            
+        Returns:
+            bool: 全部发送成功返回True
+        """
+        if not self.is_connected:
+            self.logger.error("服务器未启动")
+            return False
+        
+        writer = self._get_writer(client_address)
+        if writer is None:
+            self.logger.error("没有连接的客户端")
+            return False
+        
+        try:
+            buffers = []
+            encode = self._encode
+            pack = _FRAME_HEADER.pack
+            for command in commands:
+                data = encode(command)
+                buffers.append(pack(len(data)))
+                buffers.append(data)
+            writer.writelines(buffers)
+            await writer.drain()
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("批量数据已发送: %s条", len(commands))
+            return True
+            
         except Exception as e:
-            self.logger.error(f"接收数据失败: {e}")
+            self.logger.error("批量发送数据失败: %s", e)
+            return False
+    
+    async def receive_data(self, timeout: Optional[float] = 1.0) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
+        """
+        接收任意客户端发来的数据，发送方地址记录在client_address中
+        
+        Args:
+            timeout: 超时时间（秒），None表示一直等待
+            
+        Returns:
+            Optional[Union[Dict, TeleopMessage]]: 接收到的数据字典或消息对象
+        """
+        if not self.is_connected:
+            self.logger.error("服务器未启动")
             return None
+        
+        try:
+            self.client_address, result = await asyncio.wait_for(self._inbox.get(), timeout)
+        except asyncio.TimeoutError:
+            self.logger.debug("接收数据超时")
+            return None
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("接收到数据: %s (来自 %s)", result, self.client_address)
+        return result
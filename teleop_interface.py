@@ -3,15 +3,245 @@
 定义了遥操作接口的标准方法
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from functools import partial
+from typing import Optional, Dict, Any, List, Union, Callable, Tuple
+import gc
+import os
+import json
 import logging
+import threading
+import msgspec
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 日志记录中不使用线程/进程信息，关闭采集以降低每条日志的开销
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 
-class TeleopInterface(ABC):
+# JSON编解码函数对：dumps(obj) -> bytes, loads(bytes-like) -> obj
+JsonCodec = Tuple[Callable[[Any], bytes], Callable[[Any], Any]]
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+    return partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS), orjson.loads
+
+
+def _msgspec_codec() -> JsonCodec:
+    return msgspec.json.Encoder().encode, msgspec.json.Decoder().decode
+
+
+def _ujson_codec() -> JsonCodec:
+    import ujson
+    
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj).encode('utf-8')
+    
+    def loads(data: Any) -> Any:
+        # ujson不接受memoryview
+        return ujson.loads(bytes(data))
+    
+    return dumps, loads
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    
+    def loads(data: Any) -> Any:
+        # 标准库json不接受memoryview
+        return json.loads(bytes(data))
+    
+    return dumps, loads
+
+
+# 可选的JSON实现，按优先级排列；依赖未安装的实现在创建时抛出ImportError。
+# msgspec是必需依赖，自动选择最多回退到msgspec，ujson和标准库json需按名称显式选择
+_JSON_CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def register_json_codec(name: str, factory: Callable[[], JsonCodec]):
+    """
+    注册自定义JSON实现
+    
+    Args:
+        name: 实现名称，作为json_codec参数使用
+        factory: 返回(dumps, loads)函数对的工厂函数，依赖不可用时应抛出ImportError
+    """
+    _JSON_CODECS[name] = factory
+
+
+def get_json_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    获取JSON编解码函数对
+    
+    Args:
+        name: 实现名称（"orjson"、"msgspec"、"ujson"、"json"或已注册的名称），
+            None表示自动选择：已安装orjson时使用orjson，否则使用msgspec
+            
+    Returns:
+        JsonCodec: (dumps, loads)函数对
+    """
+    if name is not None:
+        if name not in _JSON_CODECS:
+            raise ValueError(f"未知的JSON实现: {name}，可选: {', '.join(_JSON_CODECS)}")
+        return _JSON_CODECS[name]()
+    
+    for factory in _JSON_CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    raise RuntimeError("没有可用的JSON实现")
+
+
+class TeleopMessage(msgspec.Struct, tag_field="type"):
+    """
+    遥操作消息基类
+    
+    子类通过tag区分消息类型，序列化后的"type"字段与字典格式的指令保持一致；
+    解码时指定消息类型，msgspec会直接构造对应的对象，无需先生成字典再分发。
+    """
+
+
+class MoveCommand(TeleopMessage, tag="move"):
+    """运动指令"""
+    linear_velocity: float = 0.0
+    angular_velocity: float = 0.0
+    timestamp: float = 0.0
+
+
+class StopCommand(TeleopMessage, tag="stop"):
+    """停止指令"""
+    emergency: bool = False
+    timestamp: float = 0.0
+
+
+class Feedback(TeleopMessage, tag="feedback"):
+    """机器人反馈数据"""
+    status: str = ""
+    position: List[float] = []
+    velocity: float = 0.0
+    timestamp: float = 0.0
+
+
+# 所有已定义消息类型的联合，可作为接口的message_type参数
+TeleopMsg = Union[MoveCommand, StopCommand, Feedback]
+
+
+# GC开关是进程级的，多个接口实例共享一个引用计数：第一个请求冻结时关闭GC，最后一个释放时才重新开启
+_gc_freeze_lock = threading.Lock()
+_gc_freeze_count = 0
+
+
+def _acquire_gc_freeze():
+    """增加GC冻结引用计数，从0变为1时冻结已有对象并关闭自动垃圾回收"""
+    global _gc_freeze_count
+    with _gc_freeze_lock:
+        if _gc_freeze_count == 0:
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+        _gc_freeze_count += 1
+
+
+def _release_gc_freeze():
+    """减少GC冻结引用计数，归零时解冻对象并重新开启自动垃圾回收"""
+    global _gc_freeze_count
+    with _gc_freeze_lock:
+        _gc_freeze_count -= 1
+        if _gc_freeze_count == 0:
+            gc.unfreeze()
+            gc.enable()
+
+
+class _RealtimeMixin:
+    """线程实时调度设置，供同步和异步接口共用"""
+    
+    _gc_frozen = False
+    # set_realtime()修改调度策略前的(policy, param)，None表示本实例没有修改过
+    _saved_sched = None
+    
+    def set_realtime(self, cpu_id: Optional[int] = None, priority: int = 50,
+                     freeze_gc: bool = False) -> bool:
+        """
+        将当前线程设置为实时调度，降低遥操作循环的延迟抖动
+        
+        应在运行遥操作循环的线程中调用。绑定的CPU核心建议通过内核启动参数
+        isolcpus=<cpu_id>隔离，避免其他进程被调度到该核心。
+        设置SCHED_FIFO需要root权限或CAP_SYS_NICE；不支持的平台上对应设置会被跳过。
+        
+        Args:
+            cpu_id: 绑定的CPU核心编号，None表示不绑定
+            priority: SCHED_FIFO优先级（1-99）
+            freeze_gc: 是否冻结已有对象并关闭自动垃圾回收，避免循环中出现GC停顿；
+                调用clear_realtime()恢复
+            
+        Returns:
+            bool: 所有请求的设置均生效返回True
+        """
+        success = True
+        
+        if cpu_id is not None:
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {cpu_id})
+                    self.logger.info("线程已绑定到CPU %s", cpu_id)
+                except OSError as e:
+                    self.logger.warning("绑定CPU失败: %s", e)
+                    success = False
+            else:
+                self.logger.debug("当前平台不支持绑定CPU，已跳过")
+        
+        if hasattr(os, 'sched_setscheduler'):
+            try:
+                previous = (os.sched_getscheduler(0), os.sched_getparam(0))
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                if self._saved_sched is None:
+                    # 重复调用时保留最初的调度策略
+                    self._saved_sched = previous
+                self.logger.info("已设置SCHED_FIFO调度，优先级: %s", priority)
+            except OSError as e:
+                self.logger.warning("设置实时调度失败（需要root权限或CAP_SYS_NICE）: %s", e)
+                success = False
+        else:
+            self.logger.debug("当前平台不支持实时调度，已跳过")
+        
+        if freeze_gc and not self._gc_frozen:
+            _acquire_gc_freeze()
+            self._gc_frozen = True
+        
+        return success
+    
+    def clear_realtime(self):
+        """
+        撤销本实例set_realtime()所做的修改（CPU绑定保持不变）
+        
+        只恢复本实例修改前的调度策略；其他仍处于实时模式的实例冻结了GC时，
+        GC要等到最后一个实例调用clear_realtime()后才重新开启
+        """
+        if self._saved_sched is not None:
+            policy, param = self._saved_sched
+            try:
+                os.sched_setscheduler(0, policy, param)
+                self._saved_sched = None
+            except OSError as e:
+                self.logger.warning("恢复调度策略失败: %s", e)
+        
+        if self._gc_frozen:
+            _release_gc_freeze()
+            self._gc_frozen = False
+
+
+class TeleopInterface(_RealtimeMixin, ABC):
     """遥操作接口抽象基类"""
     
     def __init__(self):
@@ -39,20 +269,34 @@ class TeleopInterface(ABC):
         pass
     
     @abstractmethod
-    def send_command(self, command: Dict[str, Any]) -> bool:
+    def send_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bool:
         """
         发送控制指令
         
         Args:
-            command: 控制指令字典，包含机器人控制参数
+            command: 控制指令字典或TeleopMessage对象，包含机器人控制参数
             
         Returns:
             bool: 发送成功返回True，否则返回False
         """
         pass
     
+    def send_commands_batch(self, commands: List[Union[Dict[str, Any], TeleopMessage]]) -> bool:
+        """
+        批量发送控制指令（如轨迹的多个设定点）
+        
+        默认逐条调用send_command，子类可重写为单次系统调用批量发送
+        
+        Args:
+            commands: 控制指令字典或TeleopMessage对象列表
+            
+        Returns:
+            bool: 全部发送成功返回True，否则返回False
+        """
+        return all(self.send_command(command) for command in commands)
+    
     @abstractmethod
-    def receive_data(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+    def receive_data(self, timeout: float = 1.0) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
         """
         接收机器人反馈数据
         
@@ -60,7 +304,93 @@ class TeleopInterface(ABC):
             timeout: 超时时间（秒）
             
         Returns:
-            Optional[Dict]: 接收到的数据字典，失败返回None
+            Optional[Union[Dict, TeleopMessage]]: 接收到的数据字典（指定了消息类型时为对应的
+                TeleopMessage对象），失败返回None
+        """
+        pass
+    
+    def check_connection(self) -> bool:
+        """
+        检查连接状态
+        
+        Returns:
+            bool: 连接正常返回True，否则返回False
+        """
+        return self.is_connected
+
+
+class AsyncTeleopInterface(_RealtimeMixin, ABC):
+    """
+    异步遥操作接口抽象基类
+    
+    方法与TeleopInterface一致，但connect/disconnect/send_command/receive_data均为协程，
+    需在asyncio事件循环中await调用
+    """
+    
+    def __init__(self):
+        self.is_connected = False
+        self.logger = logger
+    
+    @abstractmethod
+    async def connect(self) -> bool:
+        """
+        建立连接
+        
+        Returns:
+            bool: 连接成功返回True，否则返回False
+        """
+        pass
+    
+    @abstractmethod
+    async def disconnect(self) -> bool:
+        """
+        断开连接
+        
+        Returns:
+            bool: 断开成功返回True，否则返回False
+        """
+        pass
+    
+    @abstractmethod
+    async def send_command(self, command: Union[Dict[str, Any], TeleopMessage]) -> bool:
+        """
+        发送控制指令
+        
+        Args:
+            command: 控制指令字典或TeleopMessage对象，包含机器人控制参数
+            
+        Returns:
+            bool: 发送成功返回True，否则返回False
+        """
+        pass
+    
+    async def send_commands_batch(self, commands: List[Union[Dict[str, Any], TeleopMessage]]) -> bool:
+        """
+        批量发送控制指令
+        
+        默认逐条调用send_command，子类可重写为批量发送
+        
+        Args:
+            commands: 控制指令字典或TeleopMessage对象列表
+            
+        Returns:
+            bool: 全部发送成功返回True，否则返回False
+        """
+        for command in commands:
+            if not await self.send_command(command):
+                return False
+        return True
+    
+    @abstractmethod
+    async def receive_data(self, timeout: Optional[float] = 1.0) -> Optional[Union[Dict[str, Any], TeleopMessage]]:
+        """
+        接收机器人反馈数据
+        
+        Args:
+            timeout: 超时时间（秒），None表示一直等待
+            
+        Returns:
+            Optional[Union[Dict, TeleopMessage]]: 接收到的数据字典或消息对象，失败返回None
         """
         pass
     
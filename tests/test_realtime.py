@@ -0,0 +1,66 @@
+"""实时调度设置测试"""
+import gc
+import os
+import unittest
+from unittest import mock
+
+from socket_teleop import SocketTeleopInterface
+
+
+class GcFreezeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.assertTrue(gc.isenabled())
+        self.addCleanup(gc.enable)
+        # 只测试GC引用计数，不修改测试进程的调度策略
+        patcher = mock.patch.object(os, 'sched_setscheduler', create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_gc_stays_disabled_until_last_instance_clears(self):
+        first = SocketTeleopInterface(host="127.0.0.1", port=9)
+        second = SocketTeleopInterface(host="127.0.0.1", port=9)
+        first.set_realtime(freeze_gc=True)
+        second.set_realtime(freeze_gc=True)
+        self.assertFalse(gc.isenabled())
+
+        first.clear_realtime()
+        self.assertFalse(gc.isenabled())
+        first.clear_realtime()
+        self.assertFalse(gc.isenabled())
+
+        second.clear_realtime()
+        self.assertTrue(gc.isenabled())
+
+
+@unittest.skipUnless(hasattr(os, 'sched_setscheduler'), "需要sched_setscheduler")
+class SchedulerRestoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.iface = SocketTeleopInterface(host="127.0.0.1", port=9)
+
+    def test_clear_without_set_keeps_policy(self):
+        with mock.patch.object(os, 'sched_setscheduler') as setscheduler:
+            self.iface.clear_realtime()
+        setscheduler.assert_not_called()
+
+    def test_clear_after_failed_set_keeps_policy(self):
+        with mock.patch.object(os, 'sched_setscheduler',
+                               side_effect=PermissionError("权限不足")) as setscheduler:
+            self.assertFalse(self.iface.set_realtime())
+            self.iface.clear_realtime()
+        setscheduler.assert_called_once()
+
+    def test_clear_restores_previous_policy(self):
+        policy, param = os.sched_getscheduler(0), os.sched_getparam(0)
+        with mock.patch.object(os, 'sched_setscheduler') as setscheduler:
+            self.assertTrue(self.iface.set_realtime(priority=10))
+            self.iface.set_realtime(priority=20)
+            self.iface.clear_realtime()
+            self.iface.clear_realtime()
+        self.assertEqual(setscheduler.call_args_list[-1], mock.call(0, policy, param))
+        self.assertEqual(setscheduler.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
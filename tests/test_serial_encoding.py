@@ -0,0 +1,126 @@
+"""串口指令编码测试（含编码缓存与变化字段拼接）"""
+import json
+import unittest
+
+import msgspec
+
+from serial_teleop import SerialTeleopInterface
+from teleop_interface import MoveCommand, get_json_codec, register_json_codec
+
+
+def _indented_codec():
+    def dumps(obj):
+        return (json.dumps(obj, indent=2) + '\n').encode('utf-8')
+
+    def loads(data):
+        return json.loads(bytes(data))
+
+    return dumps, loads
+
+
+def _list_codec():
+    # 输出不是以'}'结尾的JSON对象，无法拼接
+    def dumps(obj):
+        return json.dumps(list(obj.items()) if isinstance(obj, dict) else obj).encode('utf-8')
+
+    def loads(data):
+        return json.loads(bytes(data))
+
+    return dumps, loads
+
+
+register_json_codec("test-indented", _indented_codec)
+register_json_codec("test-list", _list_codec)
+
+COMMANDS = [
+    {"type": "move", "speed": 100, "timestamp": 1.5},
+    {"type": "move", "speed": 100, "timestamp": 2.5},
+    {"timestamp": 3.0},
+    {},
+    {"type": "stop"},
+    {"type": "grip", "args": [1, {"force": None}], "flag": True, "timestamp": 4},
+    {"type": "grip", "args": [1, {"force": None}], "flag": 1, "timestamp": 4},
+]
+
+
+class EncodeCommandTest(unittest.TestCase):
+
+    def _decode(self, iface, data):
+        self.assertTrue(data.endswith(iface.frame_delimiter))
+        return json.loads(data[:-len(iface.frame_delimiter)])
+
+    def test_cached_encoding_round_trips(self):
+        for codec in (None, "json", "msgspec", "test-indented"):
+            with self.subTest(codec=codec):
+                iface = SerialTeleopInterface(encode_cache_size=8, json_codec=codec)
+                for command in COMMANDS * 2:
+                    self.assertEqual(self._decode(iface, iface._encode_command(command)), command)
+
+    def test_cache_reused_across_volatile_values(self):
+        iface = SerialTeleopInterface(encode_cache_size=8)
+        iface._encode_command({"type": "move", "speed": 1, "timestamp": 1.0})
+        iface._encode_command({"type": "move", "speed": 1, "timestamp": 2.0})
+        info = iface._encode_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_cache_distinguishes_equal_values_of_different_types(self):
+        iface = SerialTeleopInterface(encode_cache_size=8)
+        for value in (True, 1, 1.0):
+            command = {"flag": value}
+            self.assertIs(type(self._decode(iface, iface._encode_command(command))["flag"]), type(value))
+
+    def test_custom_volatile_keys(self):
+        iface = SerialTeleopInterface(encode_cache_size=8, volatile_keys=("seq", "timestamp"))
+        for seq in range(3):
+            command = {"type": "move", "seq": seq, "timestamp": seq / 10}
+            self.assertEqual(self._decode(iface, iface._encode_command(command)), command)
+        self.assertEqual(iface._encode_cached.cache_info().misses, 1)
+
+    def test_unhashable_values_fall_back_to_direct_encoding(self):
+        iface = SerialTeleopInterface(encode_cache_size=8)
+        command = {"type": "move", "mixed": {1: "a", "b": 2}}
+        self.assertEqual(self._decode(iface, iface._encode_command(command)), {"type": "move", "mixed": {"1": "a", "b": 2}})
+
+    def test_unspliceable_codec_output_falls_back(self):
+        iface = SerialTeleopInterface(encode_cache_size=8, json_codec="test-list")
+        command = {"type": "move", "timestamp": 1.0}
+        self.assertEqual(self._decode(iface, iface._encode_command(command)), [["type", "move"], ["timestamp", 1.0]])
+
+    def test_frame_delimiter_appended(self):
+        for cache_size in (0, 8):
+            iface = SerialTeleopInterface(encode_cache_size=cache_size, frame_delimiter=b'\r\n')
+            data = iface._encode_command({"type": "move", "timestamp": 1.0})
+            self.assertTrue(data.endswith(b'}\r\n'))
+
+    def test_message_objects_bypass_cache(self):
+        iface = SerialTeleopInterface(encode_cache_size=8)
+        data = iface._encode_command(MoveCommand(linear_velocity=0.5))
+        self.assertEqual(self._decode(iface, data)["type"], "move")
+        self.assertEqual(iface._encode_cached.cache_info().misses, 0)
+
+
+
+class JsonCodecSelectionTest(unittest.TestCase):
+
+    def test_automatic_selection_prefers_orjson_then_msgspec(self):
+        dumps, _ = get_json_codec()
+        try:
+            import orjson
+        except ImportError:
+            self.assertIsInstance(dumps.__self__, msgspec.json.Encoder)
+        else:
+            self.assertIs(dumps.func, orjson.dumps)
+
+    def test_named_codecs_round_trip(self):
+        for name in ("msgspec", "json"):
+            with self.subTest(codec=name):
+                dumps, loads = get_json_codec(name)
+                self.assertEqual(loads(memoryview(dumps({"a": [1, 2.5, None]}))), {"a": [1, 2.5, None]})
+
+    def test_unknown_codec_rejected(self):
+        with self.assertRaises(ValueError):
+            get_json_codec("no-such-codec")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""串口读取超时测试（使用伪终端模拟串口设备）"""
+import os
+import threading
+import time
+import unittest
+
+from serial_teleop import SerialTeleopInterface
+
+try:
+    import tty
+except ImportError:
+    tty = None
+
+
+@unittest.skipUnless(hasattr(os, 'openpty') and tty is not None, "需要POSIX伪终端")
+class SerialTimeoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.master, slave = os.openpty()
+        tty.setraw(self.master)
+        self.slave = slave
+        self.iface = SerialTeleopInterface(port=os.ttyname(slave), timeout=1.0)
+        self.assertTrue(self.iface.connect())
+
+    def tearDown(self):
+        self.iface.disconnect()
+        os.close(self.master)
+        os.close(self.slave)
+
+    def _elapsed(self, func, *args, **kwargs):
+        start = time.monotonic()
+        result = func(*args, **kwargs)
+        return result, time.monotonic() - start
+
+    def test_temporary_timeout_applies_to_reads_without_timeout(self):
+        with self.iface.temporary_timeout(0.1):
+            result, elapsed = self._elapsed(self.iface.receive_data)
+            self.assertIsNone(result)
+            self.assertLess(elapsed, 0.5)
+            _, elapsed = self._elapsed(self.iface.receive_raw_bytes, 4)
+            self.assertLess(elapsed, 0.5)
+            _, elapsed = self._elapsed(self.iface.receive_raw_bytes_into, bytearray(4))
+            self.assertLess(elapsed, 0.5)
+        self.assertEqual(self.iface.serial_port.timeout, 1.0)
+
+    def test_explicit_timeout_overrides_current(self):
+        with self.iface.temporary_timeout(5.0):
+            _, elapsed = self._elapsed(self.iface.receive_data, 0.1)
+            self.assertLess(elapsed, 0.5)
+
+    def test_none_timeout_blocks_until_frame_complete(self):
+        def feed():
+            os.write(self.master, b'{"a":')
+            time.sleep(0.2)
+            os.write(self.master, b'1}\n')
+
+        threading.Timer(0.1, feed).start()
+        result, elapsed = self._elapsed(self.iface.receive_data, None)
+        self.assertEqual(result, {"a": 1})
+        self.assertGreaterEqual(elapsed, 0.25)
+
+    def test_receive_into_with_none_timeout_fills_buffer(self):
+        threading.Timer(0.1, os.write, (self.master, b'abcd')).start()
+        buffer = bytearray(4)
+        self.assertEqual(self.iface.receive_raw_bytes_into(buffer, None), 4)
+        self.assertEqual(buffer, b'abcd')
+
+    def test_receive_into_with_zero_timeout_reads_waiting_bytes(self):
+        os.write(self.master, b'abcd')
+        time.sleep(0.05)
+        buffer = bytearray(4)
+        self.assertEqual(self.iface.receive_raw_bytes_into(buffer, 0), 4)
+        self.assertEqual(buffer, b'abcd')
+
+    def test_frame_split_across_reads(self):
+        os.write(self.master, b'{"a":')
+        self.assertIsNone(self.iface.receive_data(0.1))
+        os.write(self.master, b'1}\n{"b":2}\n')
+        self.assertEqual(self.iface.receive_data(0.5), {"a": 1})
+        self.assertEqual(self.iface.receive_data(0.5), {"b": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""TCP长度前缀帧读取测试"""
+import socket
+import unittest
+
+from socket_teleop import _FrameReader, _frame
+
+
+class FrameReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sender, self.receiver = socket.socketpair()
+        self.receiver.settimeout(0.1)
+        self.reader = _FrameReader(buffer_size=16, max_frame_size=1024)
+
+    def tearDown(self):
+        self.sender.close()
+        self.receiver.close()
+
+    def test_multiple_frames_in_one_segment(self):
+        self.sender.sendall(_frame(b'first') + _frame(b'') + _frame(b'third'))
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'first')
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'')
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'third')
+
+    def test_frame_larger_than_initial_buffer(self):
+        body = bytes(range(256)) * 2
+        self.sender.sendall(_frame(body))
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), body)
+
+    def test_resume_after_timeout_in_header(self):
+        data = _frame(b'payload')
+        self.sender.sendall(data[:2])
+        with self.assertRaises(socket.timeout):
+            self.reader.read_frame(self.receiver)
+        self.sender.sendall(data[2:])
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'payload')
+
+    def test_resume_after_timeout_in_body(self):
+        data = _frame(b'payload') + _frame(b'next')
+        self.sender.sendall(data[:7])
+        with self.assertRaises(socket.timeout):
+            self.reader.read_frame(self.receiver)
+        self.sender.sendall(data[7:])
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'payload')
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'next')
+
+    def test_reset_discards_partial_frame(self):
+        self.sender.sendall(_frame(b'payload')[:6])
+        with self.assertRaises(socket.timeout):
+            self.reader.read_frame(self.receiver)
+        self.reader.reset()
+        self.sender.sendall(_frame(b'fresh'))
+        self.assertEqual(bytes(self.reader.read_frame(self.receiver)), b'fresh')
+
+    def test_oversized_header_rejected_without_allocation(self):
+        # 非帧格式的数据（如JSON文本）被当作帧头时长度远超上限
+        self.sender.sendall(b'{"type": "move"}')
+        with self.assertRaises(ConnectionError):
+            self.reader.read_frame(self.receiver)
+        self.assertEqual(len(self.reader._buf), 16)
+
+    def test_peer_close_raises_connection_error(self):
+        self.sender.sendall(_frame(b'payload')[:6])
+        self.sender.close()
+        with self.assertRaises(ConnectionError):
+            self.reader.read_frame(self.receiver)
+
+
+if __name__ == '__main__':
+    unittest.main()
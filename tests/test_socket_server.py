@@ -0,0 +1,144 @@
+"""Socket服务器测试"""
+import errno
+import socket
+import threading
+import time
+import unittest
+
+from socket_teleop import SocketTeleopInterface, SocketTeleopServer
+
+
+class SocketTeleopServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = SocketTeleopServer(host="127.0.0.1", port=0)
+        self.assertTrue(self.server.connect())
+        self.port = self.server.server_socket.getsockname()[1]
+
+    def tearDown(self):
+        self.server.disconnect()
+
+    def _client(self) -> SocketTeleopInterface:
+        client = SocketTeleopInterface(host="127.0.0.1", port=self.port)
+        self.assertTrue(client.connect())
+        self.addCleanup(client.disconnect)
+        return client
+
+    def test_receive_with_none_timeout_waits_for_client(self):
+        def send_later():
+            time.sleep(0.2)
+            self._client().send_command({"type": "move"})
+
+        threading.Thread(target=send_later).start()
+        self.assertEqual(self.server.receive_data(None), {"type": "move"})
+
+    def test_round_trip(self):
+        client = self._client()
+        self.assertTrue(client.send_command({"type": "move", "speed": 1}))
+        self.assertEqual(self.server.receive_data(1.0), {"type": "move", "speed": 1})
+        self.assertTrue(self.server.send_command({"status": "ok"}))
+        self.assertEqual(client.receive_data(1.0), {"status": "ok"})
+
+    def test_disconnect_closes_pending_clients(self):
+        pending = socket.create_connection(("127.0.0.1", self.port))
+        self.addCleanup(pending.close)
+        time.sleep(0.1)
+        self.server.disconnect()
+        pending.settimeout(1.0)
+        # 服务器已关闭该连接，读取立即得到EOF或连接重置
+        try:
+            self.assertEqual(pending.recv(1), b'')
+        except ConnectionResetError:
+            pass
+
+    def test_accept_loop_survives_transient_errors(self):
+        server = SocketTeleopServer(host="127.0.0.1", port=0)
+        # 非TCP socket无法设置TCP_NODELAY，应被关闭并跳过
+        untunable, peer = socket.socketpair()
+        self.addCleanup(peer.close)
+        pending = socket.create_connection(("127.0.0.1", self.port))
+        self.addCleanup(pending.close)
+        accepted = self.server._client_queue.get(timeout=1.0)
+        self.addCleanup(accepted[0].close)
+
+        listener = _FakeListener(server, [
+            ConnectionAbortedError(errno.ECONNABORTED, "模拟握手后断开"),
+            OSError(errno.EMFILE, "模拟文件描述符耗尽"),
+            (untunable, ("127.0.0.1", 1)),
+            accepted,
+        ])
+        server._accept_loop(listener)
+        self.assertEqual(untunable.fileno(), -1)
+        self.assertIs(server._client_queue.get_nowait()[0], accepted[0])
+        self.assertTrue(server._client_queue.empty())
+
+
+class _FakeListener:
+    """按顺序返回预设结果的监听socket，结果用完后设置停止标志"""
+
+    def __init__(self, server, results):
+        self._server = server
+        self._results = list(results)
+
+    def fileno(self):
+        return 0
+
+    def accept(self):
+        if not self._results:
+            self._server._stop.set()
+            raise OSError(errno.EBADF, "监听socket已关闭")
+        result = self._results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+class SocketTeleopInterfaceTest(unittest.TestCase):
+
+    def test_tcp_peer_close_marks_disconnected_and_closes_socket(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+        client = SocketTeleopInterface(host="127.0.0.1", port=listener.getsockname()[1])
+        self.assertTrue(client.connect())
+        self.addCleanup(client.disconnect)
+        listener.accept()[0].close()
+
+        self.assertIsNone(client.receive_data(1.0))
+        self.assertFalse(client.check_connection())
+        self.assertIsNone(client.socket)
+        self.assertFalse(client.send_command({"type": "move"}))
+
+    def test_tcp_send_timeout_drops_connection(self):
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+        client = SocketTeleopInterface(host="127.0.0.1", port=listener.getsockname()[1])
+        self.assertTrue(client.connect())
+        self.addCleanup(client.disconnect)
+        self.addCleanup(listener.accept()[0].close)
+
+        self.assertFalse(client.send_command({"bad": object()}))
+        self.assertTrue(client.check_connection())
+        client._sendall = _raise_timeout
+        self.assertFalse(client.send_command({"type": "move"}))
+        self.assertFalse(client.check_connection())
+        self.assertIsNone(client.socket)
+
+    def test_udp_connection_error_keeps_connection(self):
+        client = SocketTeleopInterface(host="127.0.0.1", port=9, protocol="UDP")
+        self.assertTrue(client.connect())
+        self.addCleanup(client.disconnect)
+        client._sendto = _raise_connection_reset
+        self.assertFalse(client.send_command({"type": "move"}))
+        self.assertTrue(client.check_connection())
+
+
+def _raise_connection_reset(*args):
+    raise ConnectionResetError("模拟ICMP端口不可达")
+
+
+def _raise_timeout(*args):
+    raise socket.timeout("模拟发送超时")
+
+
+if __name__ == '__main__':
+    unittest.main()
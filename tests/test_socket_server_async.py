@@ -0,0 +1,90 @@
+"""异步Socket服务器测试"""
+import asyncio
+import unittest
+
+import msgspec
+
+from socket_teleop import SocketTeleopServerAsync, _frame
+from teleop_interface import AsyncTeleopInterface, TeleopInterface
+
+
+class SocketTeleopServerAsyncTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = SocketTeleopServerAsync(host="127.0.0.1", port=0,
+                                              max_frame_size=1024, max_pending=2)
+        self.assertTrue(await self.server.connect())
+        self.port = self.server.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.disconnect()
+
+    async def _open_client(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        self.addAsyncCleanup(self._close, writer)
+        return reader, writer
+
+    @staticmethod
+    async def _close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _wait_for_clients(self, count):
+        for _ in range(100):
+            if len(self.server.clients) == count:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"客户端数量未达到{count}")
+
+    def test_uses_async_base_class(self):
+        self.assertIsInstance(self.server, AsyncTeleopInterface)
+        self.assertNotIsInstance(self.server, TeleopInterface)
+
+    async def test_round_trip_with_multiple_clients(self):
+        clients = [await self._open_client() for _ in range(2)]
+        for i, (_, writer) in enumerate(clients):
+            writer.write(_frame(msgspec.msgpack.encode({"id": i})))
+            self.assertEqual(await self.server.receive_data(1.0), {"id": i})
+            self.assertTrue(await self.server.send_command({"ack": i}))
+            reader = clients[i][0]
+            header = await reader.readexactly(4)
+            body = await reader.readexactly(int.from_bytes(header, 'big'))
+            self.assertEqual(msgspec.msgpack.decode(body), {"ack": i})
+
+    async def test_oversized_frame_disconnects_client(self):
+        reader, writer = await self._open_client()
+        await self._wait_for_clients(1)
+        writer.write(b'{"type": "move"}')
+        self.assertEqual(await asyncio.wait_for(reader.read(), 1.0), b'')
+        await self._wait_for_clients(0)
+
+    async def test_inbox_is_bounded(self):
+        _, writer = await self._open_client()
+        for i in range(10):
+            writer.write(_frame(msgspec.msgpack.encode(i)))
+        await asyncio.sleep(0.1)
+        self.assertLessEqual(self.server._inbox.qsize(), 2)
+        received = [await self.server.receive_data(1.0) for _ in range(10)]
+        self.assertEqual(received, list(range(10)))
+
+    async def test_disconnect_with_full_inbox(self):
+        _, writer = await self._open_client()
+        for i in range(5):
+            writer.write(_frame(msgspec.msgpack.encode(i)))
+        await asyncio.sleep(0.1)
+        handlers = list(self.server._handlers)
+        self.assertEqual(len(handlers), 1)
+        self.assertTrue(await asyncio.wait_for(self.server.disconnect(), 2.0))
+        self.assertEqual(self.server.clients, [])
+        # 取消传播到读取任务本身，而不是被吞掉后正常返回
+        self.assertTrue(handlers[0].cancelled())
+
+    async def test_receive_timeout(self):
+        self.assertIsNone(await self.server.receive_data(0.05))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""io_uring批量写入测试"""
+import fcntl
+import os
+import threading
+import tty
+import unittest
+
+from uring_transport import UringTransport
+
+
+@unittest.skipUnless(UringTransport.is_supported(), "需要Linux并安装liburing")
+class UringTransportTest(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.uring = UringTransport()
+        except OSError as e:  # 内核未启用io_uring
+            self.skipTest(str(e))
+        self.addCleanup(self.uring.close)
+        self.read_fd, self.write_fd = os.pipe()
+        self.addCleanup(os.close, self.read_fd)
+        self.addCleanup(os.close, self.write_fd)
+
+    def test_write(self):
+        self.assertEqual(self.uring.write(self.write_fd, b'abc'), 3)
+        self.assertEqual(os.read(self.read_fd, 16), b'abc')
+
+    def test_batch_writes_in_order(self):
+        with self.uring.batch():
+            self.uring.write(self.write_fd, b'ab')
+            self.uring.write(self.write_fd, bytearray(b'cd'))
+            self.uring.write(self.write_fd, memoryview(b'xef')[1:])
+        self.assertEqual(os.read(self.read_fd, 16), b'abcdef')
+
+    def test_write_error_raises(self):
+        with self.assertRaises(OSError):
+            self.uring.write(self.read_fd, b'abc')
+
+    def test_batch_error_reported_after_all_ops_finish(self):
+        errors = []
+        with self.assertRaises(OSError):
+            with self.uring.batch():
+                self.uring.write(self.read_fd, b'bad', errors.append)
+                self.uring.write(self.write_fd, b'good', errors.append)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(os.read(self.read_fd, 16), b'good')
+
+    def test_batch_does_not_mask_body_exception(self):
+        with self.assertRaises(KeyError):
+            with self.uring.batch():
+                self.uring.write(self.read_fd, b'bad')
+                raise KeyError('body')
+
+
+
+@unittest.skipUnless(UringTransport.is_supported(), "需要Linux并安装liburing")
+class UringTransportPtyTest(unittest.TestCase):
+    """以非阻塞方式打开的伪终端模拟pyserial的串口，写入可能返回EAGAIN或只写入一部分"""
+
+    def setUp(self):
+        try:
+            self.uring = UringTransport()
+        except OSError as e:
+            self.skipTest(str(e))
+        self.addCleanup(self.uring.close)
+        self.master, self.slave = os.openpty()
+        self.addCleanup(os.close, self.master)
+        self.addCleanup(os.close, self.slave)
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+        flags = fcntl.fcntl(self.slave, fcntl.F_GETFL)
+        fcntl.fcntl(self.slave, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+    def _drain(self, size):
+        received = bytearray()
+
+        def read():
+            while len(received) < size:
+                try:
+                    chunk = os.read(self.master, 65536)
+                except OSError:  # 测试结束时伪终端已关闭
+                    return
+                received.extend(chunk)
+
+        thread = threading.Thread(target=read, daemon=True)
+        thread.start()
+        return received, thread
+
+    def _assert_batch_order(self, size, count=5):
+        messages = [bytes([ord('A') + i]) * size for i in range(count)]
+        received, reader = self._drain(size * count)
+        with self.uring.batch():
+            for message in messages:
+                self.uring.write(self.slave, message)
+        reader.join(10)
+        self.assertEqual(bytes(received), b''.join(messages))
+
+    def test_batch_keeps_same_fd_order_with_partial_writes(self):
+        self._assert_batch_order(5001)
+
+    def test_batch_keeps_same_fd_order_for_large_writes(self):
+        self._assert_batch_order(200000)
+
+    def test_close_waits_for_outstanding_writes(self):
+        size = 100000
+        received, reader = self._drain(size * 4)
+        results = []
+
+        def write():
+            try:
+                results.append(self.uring.write(self.slave, b'x' * size))
+            except RuntimeError:  # 关闭后提交的请求被拒绝
+                results.append(None)
+
+        writers = [threading.Thread(target=write) for _ in range(4)]
+        for writer in writers:
+            writer.start()
+        self.uring.close()
+        for writer in writers:
+            writer.join(10)
+            self.assertFalse(writer.is_alive())
+        self.assertEqual(len(results), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
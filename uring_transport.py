@@ -0,0 +1,260 @@
+"""
+基于io_uring的批量写入传输层（仅Linux，需要安装liburing）
+多个串口接口共享同一个ring，同一周期内的写操作合并为一次系统调用提交
+"""
+import os
+import sys
+import errno
+import select
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+logger = logging.getLogger(__name__)
+
+# 串口为流式设备，写偏移量会被忽略
+_STREAM_OFFSET = 0
+
+# 关闭时用于唤醒完成线程的NOP请求标识
+_SHUTDOWN_ID = 0
+
+
+class _UringOp:
+    """一次已提交的写操作，持有数据缓冲区直到内核完成"""
+
+    __slots__ = ('fd', 'data', 'result', 'event', 'error_callbacks')
+
+    def __init__(self, fd: int, data: bytes,
+                 error_callbacks: Optional[List[Callable[[OSError], None]]] = None):
+        self.fd = fd
+        self.data = data
+        self.result = None
+        self.event = threading.Event()
+        self.error_callbacks = error_callbacks or []
+
+
+class UringTransport:
+    """
+    io_uring批量写入引擎
+
+    写请求由调用线程放入提交队列，完成事件由后台守护线程通过eventfd等待并分发。
+    在 batch() 作用域内的写请求不会立即提交，而是在退出作用域时一次性提交，
+    从而把一个控制周期内多个接口的写操作合并为一次系统调用。
+    """
+
+    def __init__(self, entries: int = 64):
+        """
+        初始化io_uring
+
+        Args:
+            entries: 提交队列深度
+        """
+        if not self.is_supported():
+            raise RuntimeError("当前平台不支持io_uring（需要Linux并安装liburing）")
+
+        self._ring = liburing.Ring()
+        liburing.io_uring_queue_init(entries, self._ring)
+
+        # liburing的阻塞等待不释放GIL，完成线程改为阻塞在eventfd上
+        self._eventfd = os.eventfd(0)
+        liburing.io_uring_register_eventfd(self._ring, self._eventfd)
+
+        self._lock = threading.Lock()
+        self._ops: Dict[int, _UringOp] = {}
+        self._next_id = _SHUTDOWN_ID + 1
+        self._local = threading.local()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._completion_loop, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def is_supported() -> bool:
+        """当前环境是否可以使用io_uring"""
+        return liburing is not None and sys.platform.startswith('linux')
+
+    def _get_sqe(self):
+        """获取一个提交队列条目，队列已满时先提交已有请求（需持有锁）"""
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        if sqe is None:
+            liburing.io_uring_submit(self._ring)
+            sqe = liburing.io_uring_get_sqe(self._ring)
+        return sqe
+
+    def _enqueue(self, fd: int, data: bytes, submit: bool,
+                 error_callbacks: Optional[List[Callable[[OSError], None]]] = None) -> _UringOp:
+        """将写请求放入提交队列"""
+        if not isinstance(data, (bytes, bytearray)):
+            # liburing的prep_write只接受bytes/bytearray
+            data = bytes(data)
+        op = _UringOp(fd, data, error_callbacks)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("io_uring传输层已关闭")
+            op_id = self._next_id
+            self._next_id += 1
+            self._ops[op_id] = op
+
+            sqe = self._get_sqe()
+            liburing.io_uring_prep_write(sqe, fd, data, len(data), _STREAM_OFFSET)
+            liburing.io_uring_sqe_set_data64(sqe, op_id)
+            if submit:
+                liburing.io_uring_submit(self._ring)
+        return op
+
+    def _completion_loop(self):
+        """后台线程：等待完成事件并唤醒对应的写操作"""
+        cqe = liburing.Cqe()
+        shutting_down = False
+        while True:
+            os.eventfd_read(self._eventfd)
+            while True:
+                with self._lock:
+                    try:
+                        liburing.io_uring_peek_cqe(self._ring, cqe)
+                    except BlockingIOError:
+                        break
+                    entry = cqe[0]
+                    op_id = entry.user_data
+                    try:
+                        result = entry.res
+                    except OSError as e:  # liburing对负的返回值直接抛出异常
+                        result = -e.errno
+                    liburing.io_uring_cqe_seen(self._ring, entry)
+                    op = self._ops.pop(op_id, None)
+
+                if op_id == _SHUTDOWN_ID:
+                    shutting_down = True
+                if op is not None:
+                    op.result = result
+                    op.event.set()
+
+            # 关闭请求的完成事件可能早于之前提交的写操作，等所有写操作完成后再退出
+            if shutting_down:
+                with self._lock:
+                    if not self._ops:
+                        return
+
+    @staticmethod
+    def _finish(op: _UringOp) -> int:
+        """
+        等待写操作完成，并补写内核未写完的部分
+
+        pyserial以非阻塞方式打开串口，io_uring可能返回EAGAIN、EINTR或只写入一部分，
+        剩余数据在调用线程中用普通write补齐。
+        """
+        op.event.wait()
+        result = op.result
+        if result < 0 and -result not in (errno.EAGAIN, errno.EINTR):
+            raise OSError(-result, os.strerror(-result))
+
+        view = memoryview(op.data)[max(result, 0):]
+        while view:
+            select.select([], [op.fd], [])
+            try:
+                view = view[os.write(op.fd, view):]
+            except BlockingIOError:
+                continue
+        return len(op.data)
+
+    def write(self, fd: int, data: bytes,
+              on_error: Optional[Callable[[OSError], None]] = None) -> int:
+        """
+        写入数据
+
+        在 batch() 作用域内只入队并立即返回数据长度，实际写入在退出作用域时完成，
+        同一fd的多次写入按调用顺序合并为一次写操作；写入失败时调用on_error并由
+        batch() 抛出异常。不在批量作用域内时立即提交并等待写入完成，失败时直接抛出OSError。
+
+        Args:
+            fd: 串口文件描述符
+            data: 要写入的数据
+            on_error: 批量写入失败时的回调，参数为对应的OSError
+
+        Returns:
+            int: 写入（或入队）的字节数
+        """
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            if not isinstance(data, bytes):
+                # 退出作用域时才真正写入，可变缓冲区先拷贝，避免作用域内被修改
+                data = bytes(data)
+            pending.append((fd, data, on_error))
+            return len(data)
+        return self._finish(self._enqueue(fd, data, submit=True))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        批量提交作用域：作用域内当前线程的所有写操作在退出时一次性提交
+
+        退出时等待所有写操作完成，失败的写操作调用各自的on_error回调，
+        之后抛出第一个OSError
+
+        Example:
+            with uring.batch():
+                arm.send_command(arm_cmd)
+                gripper.send_command(gripper_cmd)
+        """
+        if getattr(self._local, 'pending', None) is not None:
+            # 已在批量作用域内，直接并入外层批次
+            yield
+            return
+
+        pending: List[Tuple[int, bytes, Optional[Callable[[OSError], None]]]] = []
+        self._local.pending = pending
+        try:
+            yield
+        finally:
+            self._local.pending = None
+            if pending:
+                # 同一fd的写入合并为一个请求：未链接的SQE可能被内核乱序执行，
+                # 部分写入又要在调用线程中补齐，分开提交会使数据在线路上乱序或交错
+                merged: Dict[int, Tuple[List[bytes], List[Callable[[OSError], None]]]] = {}
+                for fd, data, on_error in pending:
+                    buffers, callbacks = merged.setdefault(fd, ([], []))
+                    buffers.append(data)
+                    if on_error is not None and on_error not in callbacks:
+                        callbacks.append(on_error)
+
+                ops = []
+                for fd, (buffers, callbacks) in merged.items():
+                    data = buffers[0] if len(buffers) == 1 else b''.join(buffers)
+                    ops.append(self._enqueue(fd, data, submit=False, error_callbacks=callbacks))
+                with self._lock:
+                    liburing.io_uring_submit(self._ring)
+
+                first_error = None
+                for op in ops:
+                    try:
+                        self._finish(op)
+                    except OSError as e:
+                        logger.error("io_uring批量写入失败 (fd=%s): %s", op.fd, e)
+                        for callback in op.error_callbacks:
+                            callback(e)
+                        if first_error is None:
+                            first_error = e
+                # 作用域内已有异常时不覆盖它，失败已通过回调和日志报告
+                if first_error is not None and sys.exc_info()[1] is None:
+                    raise first_error
+
+    def close(self):
+        """停止完成线程并释放io_uring资源"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            sqe = self._get_sqe()
+            liburing.io_uring_prep_nop(sqe)
+            liburing.io_uring_sqe_set_data64(sqe, _SHUTDOWN_ID)
+            liburing.io_uring_submit(self._ring)
+
+        self._thread.join()
+        liburing.io_uring_queue_exit(self._ring)
+        os.close(self._eventfd)